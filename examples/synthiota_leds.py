@@ -8,50 +8,75 @@ import relic_synthiota
 DELAY = 0.1
 COLOR = 0xFF00FF
 
-synthiota = relic_synthiota.Synthiota()
+synthiota = relic_synthiota.Synthiota(auto_write=False)
+
+# preallocated buffers, only the previous and current index are updated each step
+step_buf = [0x000000] * 16
+pot_buf = [0x000000] * 8
+slider_buf = [0x000000] * 3
 
 while True:
     for i in range(16):
-        synthiota.step_leds = [COLOR if i == j else 0x000000 for j in range(16)]
+        step_buf[i - 1 if i else 15] = 0x000000
+        step_buf[i] = COLOR
+        synthiota.step_leds = step_buf
+        synthiota.flush_leds()
         time.sleep(DELAY)
-        synthiota.step_leds = 0x000000
+    synthiota.leds.fill(0x000000)
 
     for i in range(8):
-        synthiota.pot_leds = [COLOR if i == j else 0x000000 for j in range(8)]
+        pot_buf[i - 1 if i else 7] = 0x000000
+        pot_buf[i] = COLOR
+        synthiota.pot_leds = pot_buf
+        synthiota.flush_leds()
         time.sleep(DELAY)
-        synthiota.pot_leds = 0x000000
+    synthiota.leds.fill(0x000000)
 
     for i in range(3):
-        synthiota.left_slider_leds = [COLOR if i == j else 0x000000 for j in range(3)]
+        slider_buf[i - 1 if i else 2] = 0x000000
+        slider_buf[i] = COLOR
+        synthiota.left_slider_leds = slider_buf
+        synthiota.flush_leds()
         time.sleep(DELAY)
-        synthiota.left_slider_leds = 0x000000
+    synthiota.leds.fill(0x000000)
 
     synthiota.up_led = COLOR
+    synthiota.flush_leds()
     time.sleep(DELAY)
     synthiota.up_led = 0x000000
 
     synthiota.down_led = COLOR
+    synthiota.flush_leds()
     time.sleep(DELAY)
     synthiota.down_led = 0x000000
 
     for i in range(3):
-        synthiota.right_slider_leds = [COLOR if i == j else 0x000000 for j in range(3)]
+        slider_buf[i - 1 if i else 2] = 0x000000
+        slider_buf[i] = COLOR
+        synthiota.right_slider_leds = slider_buf
+        synthiota.flush_leds()
         time.sleep(DELAY)
-        synthiota.right_slider_leds = 0x000000
+    synthiota.leds.fill(0x000000)
 
     for i in range(3):
-        synthiota.mode_leds = [COLOR if i == j else 0x000000 for j in range(3)]
+        slider_buf[i - 1 if i else 2] = 0x000000
+        slider_buf[i] = COLOR
+        synthiota.mode_leds = slider_buf
+        synthiota.flush_leds()
         time.sleep(DELAY)
-        synthiota.mode_leds = 0x000000
+    synthiota.leds.fill(0x000000)
 
     synthiota.edit_led = COLOR
+    synthiota.flush_leds()
     time.sleep(DELAY)
     synthiota.edit_led = 0x000000
 
     synthiota.mode_led = COLOR
+    synthiota.flush_leds()
     time.sleep(DELAY)
     synthiota.mode_led = 0x000000
 
     synthiota.play_led = COLOR
+    synthiota.flush_leds()
     time.sleep(DELAY)
     synthiota.play_led = 0x000000
@@ -2,8 +2,10 @@
 # SPDX-FileCopyrightText: Copyright (c) 2026 Cooper Dalrymple
 #
 # SPDX-License-Identifier: Unlicense
+
+# asyncio is not built in, install it with: circup install asyncio
+import asyncio
 import random
-import time
 
 import displayio
 import synthio
@@ -36,36 +38,44 @@ synth.envelope = synthio.Envelope(attack_time=0.05, attack_level=0.8, release_ti
 synthiota.mixer.voice[0].play(synth)
 synthiota.mixer.voice[0].level = 0.25  # 0.25 usually better for headphones, 1.0 for line-in
 
-notenum = None
-note_counter = 0
-last_timestamp = time.monotonic()
-while True:
-    synthiota.update()
-
-    # synth
-    current_timestamp = time.monotonic()
-    delta = current_timestamp - last_timestamp
-    last_timestamp = current_timestamp
-    if (note_counter := note_counter - delta) <= 0:
-        if notenum is None:
-            notenum = random.randint(32, 60)
-            synth.press(notenum)
-            synthiota.send_midi_message(tmidi.Message(tmidi.NOTE_ON, data0=notenum, data1=127))
-            note_counter = 0.3
-        else:
-            synth.release(notenum)
-            synthiota.send_midi_message(tmidi.Message(tmidi.NOTE_OFF, data0=notenum))
-            notenum = None
-            note_counter = 0.5
-
-    # controls
-    print("Encoder Position:", synthiota.encoder.position)
-    print("Encoder Switch:", synthiota.encoder_button.pressed)
-    print("Up:", synthiota.up_button.pressed)
-    print("Down:", synthiota.down_button.pressed)
-    print("Left Slider:", synthiota.left_slider.value)
-    print("Right Slider:", synthiota.right_slider.value)
-    print("Steps:", "".join([str(int(x)) for x in synthiota.touched_steps]))
-    print("Pots:", synthiota.pots)
-    print()
-    time.sleep(0.05)
+steps = bytearray(16)  # reused to print the state of each step pad as "0" or "1"
+
+
+async def notes():
+    while True:
+        notenum = random.randint(32, 60)
+        synth.press(notenum)
+        synthiota.send_midi_message(tmidi.Message(tmidi.NOTE_ON, data0=notenum, data1=127))
+        await asyncio.sleep(0.3)
+
+        synth.release(notenum)
+        synthiota.send_midi_message(tmidi.Message(tmidi.NOTE_OFF, data0=notenum))
+        await asyncio.sleep(0.5)
+
+
+async def controls():
+    while True:
+        synthiota.update()
+
+        print("Encoder Position:", synthiota.encoder.position)
+        print("Encoder Switch:", synthiota.encoder_button.pressed)
+        print("Up:", synthiota.up_button.pressed)
+        print("Down:", synthiota.down_button.pressed)
+        print("Left Slider:", synthiota.left_slider.value)
+        print("Right Slider:", synthiota.right_slider.value)
+        for i, x in enumerate(synthiota.touched_steps):
+            steps[i] = 0x30 + x
+        print("Steps:", steps.decode())
+        print("Pots:", synthiota.pots)
+        print()
+        await asyncio.sleep(0.05)
+
+
+async def main():
+    await asyncio.gather(
+        asyncio.create_task(notes()),
+        asyncio.create_task(controls()),
+    )
+
+
+asyncio.run(main())
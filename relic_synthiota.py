@@ -58,7 +58,7 @@ import usb_midi
 from micropython import const
 
 try:
-    from typing import Optional, Tuple
+    from typing import List, Optional, Tuple
 except ImportError:
     pass
 
@@ -88,6 +88,8 @@ _ADC_MUX_PINS = (board.GP9, board.GP8, board.GP7)
 _ADC_PIN = board.GP26
 _ADC_COUNT = const(8)
 _ADC_SMOOTH_SHIFT = const(3)
+_ADC_SCALE = 1 / 65535
+_ADC_SCAN_ORDER = bytes((0, 1, 3, 2, 6, 7, 5, 4))  # gray code, only one mux pin changes per step
 
 _ENCODER_A_PIN = board.GP27
 _ENCODER_B_PIN = board.GP28
@@ -100,7 +102,9 @@ _I2S_BCLK_PIN = board.GP20
 _I2S_LRCLK_PIN = board.GP21
 _I2S_DATA_PIN = board.GP22
 
-_MPR121_I2C_ADDRS = (0x5A, 0x5B)
+_MPR121_I2C_ADDRS = bytes((0x5A, 0x5B))
+# touch status (2), out-of-range status (2), and filtered data of all 12 electrodes (24)
+_MPR121_BLOCK_SIZE = const(28)
 
 # program constants
 
@@ -108,18 +112,30 @@ _DEFAULT_SAMPLE_RATE = const(44100)
 _DEFAULT_CHANNEL_COUNT = const(2)
 _DEFAULT_BUFFER_SIZE = const(4096)
 
+_MIDI_MESSAGE_LIMIT = const(16)
+
 _DISPLAY_WIDTH = const(132)
 _DISPLAY_HEIGHT = const(64)
 
-# map touch id to led index
-_PAD_TO_LED = (7, 6, 5, 4, 3, 2, 1, 0, 8, 9, 10, 11, 18, 17, 16, 15, 23, 22, 21, 20, 19, 12, 13, 14)
+# map touch id to led index, leds 0-23 are in turn wired to touch ids
+# 7, 6, 5, 4, 3, 2, 1, 0, 8, 9, 10, 11, 18, 17, 16, 15, 23, 22, 21, 20, 19, 12, 13, 14
+_PAD_TO_LED = bytes(
+    (7, 6, 5, 4, 3, 2, 1, 0, 8, 9, 10, 11, 21, 22, 23, 15, 14, 13, 12, 20, 19, 18, 17, 16)
+)
 
+_LED_UP = const(19)  # _PAD_TO_LED[_PAD_UP]
+_LED_DOWN = const(20)  # _PAD_TO_LED[_PAD_DOWN]
 _LED_EDIT = const(24)
 _LED_MODE = const(25)
 _LED_PLAY = const(26)
 
 # map step pads to an index
-_STEP_PADS = (7, 6, 5, 4, 3, 2, 1, 0, 8, 9, 10, 11, 18, 17, 16, 15)
+_STEP_PADS = bytes((7, 6, 5, 4, 3, 2, 1, 0, 8, 9, 10, 11, 18, 17, 16, 15))
+
+# map touch id to step index, 0xFF for pads which are not steps
+_PAD_TO_STEP = bytes(
+    (7, 6, 5, 4, 3, 2, 1, 0, 8, 9, 10, 11, 255, 255, 255, 15, 14, 13, 12, 255, 255, 255, 255, 255)
+)
 
 # pad defs
 _PAD_DOWN = const(19)
@@ -128,24 +144,41 @@ _PAD_UP = const(20)
 _PAD_RSLIDE_A = const(12)
 _PAD_RSLIDE_B = const(13)
 _PAD_RSLIDE_C = const(14)
-_RSLIDE_PADS = (_PAD_RSLIDE_A, _PAD_RSLIDE_B, _PAD_RSLIDE_C)
+_RSLIDE_PADS = bytes((_PAD_RSLIDE_A, _PAD_RSLIDE_B, _PAD_RSLIDE_C))
 
 _PAD_LSLIDE_A = const(23)
 _PAD_LSLIDE_B = const(22)
 _PAD_LSLIDE_C = const(21)
-_LSLIDE_PADS = (_PAD_LSLIDE_A, _PAD_LSLIDE_B, _PAD_LSLIDE_C)
+_LSLIDE_PADS = bytes((_PAD_LSLIDE_A, _PAD_LSLIDE_B, _PAD_LSLIDE_C))
+
+
+def _unpack_touched(
+    value: int, changed: int, touched: bytearray, steps: bytearray, events: list
+) -> None:
+    # only visit the pads whose bit has changed
+    i = 0
+    while changed:
+        if changed & 1:
+            state = (value >> i) & 1
+            touched[i] = state
+            if (step := _PAD_TO_STEP[i]) != 0xFF:
+                steps[step] = state
+            events.append((i, state == 1))
+        changed >>= 1
+        i += 1
 
 
 class Slider:
     """Simple capacitive touch slider made from three pads attached to an MPR121."""
 
-    def __init__(  # noqa: PLR0913
+    def __init__(  # noqa: PLR0913, PLR0917
         self,
         pads: list,
         wrap: bool = False,
         offset: int = 0,
         scale: int = None,
         pull: Optional[digitalio.Pull] = None,
+        data: Optional[array.array] = None,
     ):
         """Create a Slider object using the provided MPR121 channels.
 
@@ -155,6 +188,9 @@ class Slider:
         :param scale: The size of each pad, defaults to 0.333.
         :param pull: Specify external pull resistor type. If `None`, assume pull-down or
             chip-specific implementation that does not require a pull.
+        :param data: An optional array of 3 filtered data values to read from instead of querying
+            each channel individually. The owner of the array is responsible for keeping it up to
+            date.
         """
         if len(pads) != 3:
             raise ValueError("Invalid number of pads")
@@ -169,7 +205,28 @@ class Slider:
             else (digitalio.Pull.UP if sys.platform == "RP2350" else digitalio.Pull.DOWN)
         )
 
+        self._data = data
+        self._sign = 1 if self._pull is digitalio.Pull.DOWN else -1
+
+        # position of each pad along the slider
+        self._positions = tuple([self._scale * i for i in range(len(self._channels))])
+
+        # map which pads are touched, (a >= 0) | (b >= 0) << 1 | (c >= 0) << 2, to the touched
+        # segment of the slider as (pad, next pad) or (pad, None) when on a single pad
+        self._segments = (
+            None,
+            (0, None),
+            (1, None),
+            (0, 1),
+            (2, None) if wrap else None,
+            (2, 0) if wrap else (0, None),
+            (1, 2),
+            (0, 1),
+        )
+
         self._threshold = [0] * len(self._channels)
+        self._inv_threshold = [0.0] * len(self._channels)
+        self._raw = array.array("f", [0.0] * len(self._channels))
         self._value = 0
         self.reset()
 
@@ -180,42 +237,48 @@ class Slider:
             self._threshold[i] = (
                 value if value > 0 else (1 if self._pull is digitalio.Pull.DOWN else 254)
             )
+            # bake the pull direction into the inverse so that pad values only need a multiply
+            self._inv_threshold[i] = self._sign / self._threshold[i]
+
+    def _update_raw(self) -> None:
+        data = self._data
+        threshold = self._threshold
+        inv_threshold = self._inv_threshold
+        for i in range(len(self._channels)):
+            value = data[i] if data is not None else self._channels[i].raw_value
+            self._raw[i] = (value - threshold[i]) * inv_threshold[i]
 
     @property
     def raw_value(self) -> Tuple[float]:
         """Get the relative position value of each slider pad."""
-        return tuple(
-            [
-                (x.raw_value - self._threshold[i])
-                / self._threshold[i]
-                * (1 if self._pull is digitalio.Pull.DOWN else -1)
-                for i, x in enumerate(self._channels)
-            ]
-        )
+        self._update_raw()
+        return tuple(self._raw)
 
     @property
     def value(self) -> float:
         """Get the position of the slider as a number from 0 to 1 or returns `None` if there is no
         touch detected.
         """
-        a, b, c = self.raw_value
+        if self._data is not None:
+            # exit early if no pad is above its threshold to avoid the float math
+            for i in range(len(self._channels)):
+                if (self._data[i] - self._threshold[i]) * self._sign >= 0:
+                    break
+            else:
+                return None
+
+        self._update_raw()
+        raw = self._raw
         value = None
 
-        # cases when finger is touching two pads
-        if a >= 0 and b >= 0:
-            value = self._scale * (0 + (b / (a + b)))
-        elif b >= 0 and c >= 0:
-            value = self._scale * (1 + (c / (b + c)))
-        elif c >= 0 and a >= 0 and self._wrap:
-            value = self._scale * (2 + (a / (c + a)))
-
-        # special cases when finger is just on a single pad
-        elif a > 0 and b <= 0 and c <= 0:
-            value = 0 * self._scale
-        elif a <= 0 and b > 0 and c <= 0:
-            value = 1 * self._scale
-        elif a <= 0 and b <= 0 and c > 0 and self._wrap:
-            value = 2 * self._scale
+        segment = self._segments[(raw[0] >= 0) | (raw[1] >= 0) << 1 | (raw[2] >= 0) << 2]
+        if segment is not None:
+            i, j = segment
+            if j is not None:  # finger is touching two pads
+                value = self._positions[i] + self._scale * (raw[j] / (raw[i] + raw[j]))
+            elif raw[i] > 0 and raw[(i + 1) % 3] <= 0 and raw[(i + 2) % 3] <= 0:
+                # finger is just on a single pad
+                value = self._positions[i]
 
         if value is not None:  # i.e. if touched
             # filter noise
@@ -232,12 +295,14 @@ class Slider:
 class Synthiota:  # noqa: PLR0904
     """Helper library for Synthiota."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913, PLR0915, PLR0917
         self,
         voice_count: int = 1,
         sample_rate: int = _DEFAULT_SAMPLE_RATE,
         channel_count: int = _DEFAULT_CHANNEL_COUNT,
         buffer_size: int = _DEFAULT_BUFFER_SIZE,
+        auto_refresh: bool = True,
+        auto_write: bool = True,
     ):
         """Setup hardware resources including audio output, midi usb/uart, touch inputs, display,
         neopixels, encoder, and potentiometers.
@@ -248,8 +313,15 @@ class Synthiota:  # noqa: PLR0904
         :param channel_count: The number of channels the source samples contain. 1 = mono; 2 =
             stereo.
         :type channel_count: int
-        :param buffer_size: The total size in bytes of the buffers to mix into
+        :param buffer_size: The total size in bytes of the buffers to mix into. Increase this if
+            the audio output glitches while the display or other peripherals are busy.
         :type buffer_size: int
+        :param auto_refresh: Whether or not the display automatically refreshes. Disable this and
+            call ``display.refresh()`` yourself to control when display updates occur.
+        :type auto_refresh: bool
+        :param auto_write: Whether or not LED changes are written immediately. Disable this and
+            call :meth:`flush_leds` to send all changes at once.
+        :type auto_write: bool
         """
 
         # audio
@@ -289,6 +361,7 @@ class Synthiota:  # noqa: PLR0904
             if len(usb_midi.ports) >= 2
             else None
         )
+        self._midi_messages = []
 
         # touch
         self._i2c = busio.I2C(
@@ -300,19 +373,43 @@ class Synthiota:  # noqa: PLR0904
             [adafruit_mpr121.MPR121(self._i2c, address=a) for a in _MPR121_I2C_ADDRS]
         )
         self._mpr121[1]._write_register_byte(adafruit_mpr121.MPR121_CONFIG1, 0x10)
-        self._mpr121_touched = [False] * (len(_MPR121_I2C_ADDRS) * 12)
+        self._mpr121_touched = bytearray(len(_MPR121_I2C_ADDRS) * 12)
+        self._mpr121_touched_bits = 0
+        self._mpr121_touched_steps = bytearray(len(_STEP_PADS))
+        self._mpr121_touched_view = memoryview(self._mpr121_touched)
+        self._mpr121_touched_steps_view = memoryview(self._mpr121_touched_steps)
+        self._mpr121_touch_events = []
+        self._mpr121_register = bytes((adafruit_mpr121.MPR121_TOUCHSTATUS_L,))
+        self._mpr121_buffer = bytearray(_MPR121_BLOCK_SIZE)
+        # filtered data is only needed from chips with slider pads, others only read touch status
+        self._mpr121_read_size = bytes(
+            [
+                _MPR121_BLOCK_SIZE
+                if any([pad // 12 == i for pad in _LSLIDE_PADS + _RSLIDE_PADS])
+                else 2
+                for i in range(len(_MPR121_I2C_ADDRS))
+            ]
+        )
 
         self._up_button = adafruit_debouncer.Button(
-            lambda: self._mpr121_touched[_PAD_UP],
+            lambda touched=self._mpr121_touched: touched[_PAD_UP],
             value_when_pressed=True,
         )
         self._down_button = adafruit_debouncer.Button(
-            lambda: self._mpr121_touched[_PAD_DOWN],
+            lambda touched=self._mpr121_touched: touched[_PAD_DOWN],
             value_when_pressed=True,
         )
 
-        self._left_slider = Slider([self._mpr121[i // 12][i % 12] for i in _LSLIDE_PADS])
-        self._right_slider = Slider([self._mpr121[i // 12][i % 12] for i in _RSLIDE_PADS])
+        self._left_slider_data = array.array("H", [0] * len(_LSLIDE_PADS))
+        self._left_slider = Slider(
+            [self._mpr121[i // 12][i % 12] for i in _LSLIDE_PADS],
+            data=self._left_slider_data,
+        )
+        self._right_slider_data = array.array("H", [0] * len(_RSLIDE_PADS))
+        self._right_slider = Slider(
+            [self._mpr121[i // 12][i % 12] for i in _RSLIDE_PADS],
+            data=self._right_slider_data,
+        )
 
         # display
         displayio.release_displays()
@@ -331,11 +428,19 @@ class Synthiota:  # noqa: PLR0904
             width=_DISPLAY_WIDTH,
             height=_DISPLAY_HEIGHT,
             colstart=3,
+            auto_refresh=auto_refresh,
         )
 
         # leds
-        self._leds = neopixel.NeoPixel(_LED_PIN, _LED_COUNT, brightness=_LED_BRIGHTNESS)
+        self._leds = neopixel.NeoPixel(
+            _LED_PIN,
+            _LED_COUNT,
+            brightness=_LED_BRIGHTNESS,
+            auto_write=auto_write,
+        )
         self._leds.fill(0x000000)
+        if not auto_write:
+            self._leds.show()
 
         # encoder
         self._encoder = rotaryio.IncrementalEncoder(
@@ -351,11 +456,12 @@ class Synthiota:  # noqa: PLR0904
         # potentiometers
         self._adc = analogio.AnalogIn(_ADC_PIN)
         self._adc_raw_value = array.array("H", [0] * _ADC_COUNT)
-        self._adc_value = [0] * _ADC_COUNT
         self._adc_mux_pins = tuple([digitalio.DigitalInOut(pin) for pin in _ADC_MUX_PINS])
         for dio in self._adc_mux_pins:
             dio.direction = digitalio.Direction.OUTPUT
             dio.value = False
+        self._adc_mux_a, self._adc_mux_b, self._adc_mux_c = self._adc_mux_pins
+        self._adc_mux_index = 0
 
         # prime ADC accumulators
         for i in range(50):
@@ -366,35 +472,84 @@ class Synthiota:  # noqa: PLR0904
         self._left_slider.reset()
         self._right_slider.reset()
 
-    def _adc_mux_select(self, index: int) -> None:
-        for i, dio in enumerate(self._adc_mux_pins):
-            dio.value = bool(index & (1 << i))
+        # prime the cached touch state and slider data
+        self._update_mpr121()
 
-    def _get_adc_value(self, index: int) -> int:
-        self._adc_mux_select(index)
-        return self._adc.value
+    def _adc_mux_select(self, index: int) -> None:
+        changed = index ^ self._adc_mux_index
+        if changed & 1:
+            self._adc_mux_a.value = index & 1
+        if changed & 2:
+            self._adc_mux_b.value = index & 2
+        if changed & 4:
+            self._adc_mux_c.value = index & 4
+        self._adc_mux_index = index
 
     def _update_adc_values(self) -> None:
-        for i in range(_ADC_COUNT):
-            value = self._get_adc_value(i)
-            self._adc_raw_value[i] += (value - self._adc_raw_value[i]) >> _ADC_SMOOTH_SHIFT
-            self._adc_value[i] = self._adc_raw_value[i] / 65535
+        # sweep all channels in a single pass with the adc and buffer held in locals
+        adc = self._adc
+        raw_value = self._adc_raw_value
+        for i in _ADC_SCAN_ORDER:
+            self._adc_mux_select(i)
+            raw_value[i] += (adc.value - raw_value[i]) >> _ADC_SMOOTH_SHIFT
+
+    def _update_slider_data(self, chip: int, pads: bytes, data: array.array) -> None:
+        # decode the filtered data of the slider pads on this chip from the last block read
+        for i, pad in enumerate(pads):
+            if pad // 12 == chip:
+                j = (pad % 12) * 2
+                data[i] = self._mpr121_buffer[4 + j] | (self._mpr121_buffer[5 + j] << 8)
+
+    def _update_mpr121(self) -> None:
+        # read touch status and filtered data of each chip in a single transaction while only
+        # locking the bus once for all chips
+        touched = 0
+        while not self._i2c.try_lock():
+            pass
+        try:
+            for i, address in enumerate(_MPR121_I2C_ADDRS):
+                self._i2c.writeto_then_readfrom(
+                    address,
+                    self._mpr121_register,
+                    self._mpr121_buffer,
+                    in_end=self._mpr121_read_size[i],
+                )
+                status = self._mpr121_buffer[0] | ((self._mpr121_buffer[1] & 0x0F) << 8)
+                touched |= status << (i * 12)
+                self._update_slider_data(i, _LSLIDE_PADS, self._left_slider_data)
+                self._update_slider_data(i, _RSLIDE_PADS, self._right_slider_data)
+        finally:
+            self._i2c.unlock()
+
+        # only unpack the pads whose touch state has changed
+        self._mpr121_touch_events.clear()
+        if changed := touched ^ self._mpr121_touched_bits:
+            self._mpr121_touched_bits = touched
+            _unpack_touched(
+                touched,
+                changed,
+                self._mpr121_touched,
+                self._mpr121_touched_steps,
+                self._mpr121_touch_events,
+            )
 
     def update(self) -> None:
         """Update buttons, potentiometers, and touch inputs. Call this frequently for the best
-        results!
+        results! All 8 potentiometers are sampled and smoothed on every call, so a reading
+        reaches about two thirds of a change after 8 calls and settles after about 24.
         """
+        # select the first potentiometer so that the mux settles while other inputs are read
+        self._adc_mux_select(_ADC_SCAN_ORDER[0])
+
         # touch
-        for i, x in enumerate(self._mpr121):
-            for j, v in enumerate(x.touched_pins):
-                self._mpr121_touched[i * 12 + j] = v
+        self._update_mpr121()
 
-        # buttons
-        self._up_button.update()
-        self._down_button.update()
-        self._encoder_button.update()
+        # buttons, pass in the current state to avoid calling each predicate
+        self._up_button.update(self._mpr121_touched[_PAD_UP])
+        self._down_button.update(self._mpr121_touched[_PAD_DOWN])
+        self._encoder_button.update(self._encoder_switch.value)
 
-        # potentiometers
+        # potentiometers, the first channel is already selected
         self._update_adc_values()
 
     @property
@@ -434,9 +589,17 @@ class Synthiota:  # noqa: PLR0904
 
     @property
     def leds(self) -> neopixel.NeoPixel:
-        """The neopixel driver which controls all 27 leds on the device."""
+        """The neopixel driver which controls all 27 leds on the device. If the Synthiota was
+        created with ``auto_write=False``, call :meth:`flush_leds` once any changes have been made.
+        """
         return self._leds
 
+    def flush_leds(self) -> None:
+        """Write all pending LED changes to the NeoPixels. When ``auto_write`` is disabled, call
+        this once per frame after updating any of the LED properties.
+        """
+        self._leds.show()
+
     @property
     def encoder(self) -> rotaryio.IncrementalEncoder:
         """The incremental encoder object."""
@@ -449,8 +612,19 @@ class Synthiota:  # noqa: PLR0904
 
     @property
     def pots(self) -> Tuple[Optional[float]]:
-        """All 8 potentiometer values as a tuple of floats from 0 to 1."""
-        return tuple(self._adc_value)
+        """All 8 potentiometer values as a tuple of floats from 0 to 1. Values are smoothed,
+        reaching about two thirds of a change after 8 calls to :meth:`update` and settling after
+        about 24.
+        """
+        return tuple([x * _ADC_SCALE for x in self._adc_raw_value])
+
+    def get_pot(self, index: int) -> float:
+        """Get the value of a single potentiometer as a float from 0 to 1. Use this instead of
+        :attr:`pots` when only one value is needed.
+
+        :param index: The index of the potentiometer from left-to-right, 0 through 7.
+        """
+        return self._adc_raw_value[index] * _ADC_SCALE
 
     @property
     def pot_leds(self) -> Optional[PixelReturnSequence]:
@@ -466,16 +640,36 @@ class Synthiota:  # noqa: PLR0904
         self._leds[16:24] = value
 
     @property
-    def touched(self) -> Tuple[Optional[bool]]:
-        """The state of all touchpads as a tuple of 24 booleans."""
-        return tuple(self._mpr121_touched)
+    def touched(self) -> memoryview:
+        """The state of all touchpads as 24 values of 1 (touched) or 0 (not touched). This is a
+        view of the internal buffer, so it is updated in place by :meth:`update`. Make a copy if
+        you need to retain the previous state.
+        """
+        return self._mpr121_touched_view
+
+    @property
+    def touched_bits(self) -> int:
+        """The state of all touchpads as a 24-bit integer where bit ``n`` is set while pad ``n``
+        is touched. Use this to check several pads at once without iterating over
+        :attr:`touched`.
+        """
+        return self._mpr121_touched_bits
 
     @property
-    def touched_steps(self) -> Tuple[Optional[bool]]:
+    def touched_steps(self) -> memoryview:
         """The state of all 16 step touch pads in left-to-right order from bottom-left to
-        top-right.
+        top-right as values of 1 (touched) or 0 (not touched). Like :attr:`touched`, this is a view
+        of an internal buffer which is updated in place.
         """
-        return tuple([self._mpr121_touched[i] for i in _STEP_PADS])
+        return self._mpr121_touched_steps_view
+
+    @property
+    def touch_events(self) -> List[Tuple[int, bool]]:
+        """The touchpads which changed state during the last call to :meth:`update` as a list of
+        ``(pad, pressed)`` tuples. Unlike :attr:`up_button` and :attr:`down_button`, these events
+        are not debounced. The list is reused by each update.
+        """
+        return self._mpr121_touch_events
 
     @property
     def step_leds(self) -> Optional[PixelReturnSequence]:
@@ -500,11 +694,11 @@ class Synthiota:  # noqa: PLR0904
     @property
     def up_led(self) -> Optional[PixelReturnType]:
         """The NeoPixel above the up button."""
-        return self._leds[_PAD_TO_LED.index(_PAD_UP)]
+        return self._leds[_LED_UP]
 
     @up_led.setter
     def up_led(self, value: Optional[PixelType]) -> None:
-        self._leds[_PAD_TO_LED.index(_PAD_UP)] = value
+        self._leds[_LED_UP] = value
 
     @property
     def down_button(self) -> adafruit_debouncer.Button:
@@ -514,11 +708,11 @@ class Synthiota:  # noqa: PLR0904
     @property
     def down_led(self) -> Optional[PixelReturnType]:
         """The NeoPixel above the down button."""
-        return self._leds[_PAD_TO_LED.index(_PAD_DOWN)]
+        return self._leds[_LED_DOWN]
 
     @down_led.setter
     def down_led(self, value: Optional[PixelType]) -> None:
-        self._leds[_PAD_TO_LED.index(_PAD_DOWN)] = value
+        self._leds[_LED_DOWN] = value
 
     @property
     def left_slider(self) -> Slider:
@@ -596,15 +790,46 @@ class Synthiota:  # noqa: PLR0904
     def play_led(self, value: Optional[PixelType]) -> None:
         self._leds[_LED_PLAY] = value
 
-    def get_midi_messages(self) -> Tuple[Optional[tmidi.Message]]:
-        """Read all available messages from both the USB and UART MIDI ports."""
-        msgs = []
-        while (
-            msg := (self._midi_usb.receive() if self._midi_usb is not None else None)
-            or self._midi_uart.receive()
-        ):
-            msgs.append(msg)
-        return tuple(msgs)
+    def get_pad_led(self, pad: int) -> Optional[PixelReturnType]:
+        """Get the NeoPixel corresponding to a touchpad.
+
+        :param pad: The index of the touchpad, 0 through 23, as used by :attr:`touched` and
+            :attr:`touch_events`.
+        """
+        return self._leds[_PAD_TO_LED[pad]]
+
+    def set_pad_led(self, pad: int, value: Optional[PixelType]) -> None:
+        """Set the NeoPixel corresponding to a touchpad.
+
+        :param pad: The index of the touchpad, 0 through 23, as used by :attr:`touched` and
+            :attr:`touch_events`.
+        :param value: The color of the NeoPixel.
+        """
+        self._leds[_PAD_TO_LED[pad]] = value
+
+    def get_midi_messages(self) -> List[Optional[tmidi.Message]]:
+        """Read available messages from both the USB and UART MIDI ports, alternating between them
+        so that a busy port cannot hold back the other. At most 16 messages are returned per call,
+        any remaining messages will be read on the next call.
+
+        The same list object is reused and cleared on every call, so make a copy if you need to
+        keep the messages beyond the next call.
+        """
+        msgs = self._midi_messages
+        msgs.clear()
+        usb, uart = self._midi_usb, self._midi_uart  # set to None once a port is empty
+        while (usb is not None or uart is not None) and len(msgs) < _MIDI_MESSAGE_LIMIT:
+            if usb is not None:
+                if msg := usb.receive():
+                    msgs.append(msg)
+                else:
+                    usb = None
+            if uart is not None and len(msgs) < _MIDI_MESSAGE_LIMIT:
+                if msg := uart.receive():
+                    msgs.append(msg)
+                else:
+                    uart = None
+        return msgs
 
     def send_midi_message(self, message: tmidi.Message) -> None:
         """Send a message to both the USB and UART MIDI ports.